@@ -3,14 +3,15 @@ import base64
 import dataclasses
 import datetime  # noqa: I251
 from collections.abc import Mapping as C_Mapping, Sequence as C_Sequence
-from typing import Any, Type, Union
+from typing import Any, Callable, Dict, Tuple, Type, Union
 from enum import Enum
 
 from dlt.common.json import custom_pua_remove, json
 from dlt.common.json._simplejson import custom_encode as json_custom_encode
+from dlt.common.pendulum import pendulum
 from dlt.common.wei import Wei
 from dlt.common.arithmetics import InvalidOperation, Decimal
-from dlt.common.data_types.typing import TDataType
+from dlt.common.data_types.typing import TDataType, DATA_TYPES
 from dlt.common.time import (
     ensure_pendulum_datetime,
     ensure_pendulum_date,
@@ -19,17 +20,31 @@ from dlt.common.time import (
 from dlt.common.utils import map_nested_in_place, str2bool
 
 
+_PY_TYPE_TO_SC_TYPE: Dict[Type[Any], TDataType] = {
+    str: "text",
+    float: "double",
+    bool: "bool",
+    int: "bigint",
+    dict: "json",
+    list: "json",
+    Wei: "wei",
+    Decimal: "decimal",
+    datetime.datetime: "timestamp",
+    pendulum.DateTime: "timestamp",
+    datetime.date: "date",
+    pendulum.Date: "date",
+    datetime.time: "time",
+    pendulum.Time: "time",
+    bytes: "binary",
+}
+"""Data types of exact python types, subclasses are resolved by `py_type_to_sc_type`"""
+
+
 def py_type_to_sc_type(t: Type[Any]) -> TDataType:
     # start with most popular types
-    if t is str:
-        return "text"
-    if t is float:
-        return "double"
-    # bool is subclass of int so must go first
-    if t is bool:
-        return "bool"
-    if t is int:
-        return "bigint"
+    sc_t = _PY_TYPE_TO_SC_TYPE.get(t)
+    if sc_t is not None:
+        return sc_t
     if issubclass(t, (dict, list)):
         return "json"
 
@@ -91,111 +106,173 @@ def coerce_from_date_types(
     raise TypeError(f"Cannot convert timestamp to {to_type}")
 
 
-def coerce_value(to_type: TDataType, from_type: TDataType, value: Any) -> Any:
-    if to_type == from_type:
-        if to_type == "json":
-            # nested types need custom encoding to be removed
-            return map_nested_in_place(custom_pua_remove, value)
-        # Make sure we use enum value instead of the object itself
-        # This check is faster than `isinstance(value, Enum)` for non-enum types
-        if hasattr(value, "value"):
-            if to_type == "text":
-                return str(value.value)
-            elif to_type == "bigint":
-                return int(value.value)
-        return value
+def _text_to_json(value: str) -> Any:
+    try:
+        return json.loads(value)
+    except Exception:
+        raise ValueError(value)
 
-    if to_type == "json":
-        # try to coerce from text
-        if from_type == "text":
-            try:
-                return json.loads(value)
-            except Exception:
-                raise ValueError(value)
 
-    if to_type == "text":
-        if from_type == "json":
-            return json_to_str(value)
-        else:
-            # use the same string encoding as in json
-            try:
-                return str(json_custom_encode(value))
-            except TypeError:
-                # for other types use internal conversion
-                return str(value)
-
-    if to_type == "binary":
-        if from_type == "text":
-            if value.startswith("0x"):
-                return bytes.fromhex(value[2:])
-            try:
-                return base64.b64decode(value, validate=True)
-            except binascii.Error:
-                raise ValueError(value)
-        if from_type == "bigint":
-            return value.to_bytes((value.bit_length() + 7) // 8, "little")
+def _to_text(value: Any) -> str:
+    # use the same string encoding as in json
+    try:
+        return str(json_custom_encode(value))
+    except TypeError:
+        # for other types use internal conversion
+        return str(value)
 
-    if to_type == "bigint":
-        if from_type in ["wei", "decimal", "double"]:
-            if value % 1 != 0:
-                # only integer decimals and floats can be coerced
-                raise ValueError(value)
-            return int(value)
-        if from_type == "text":
-            trim_value = value.strip()
-            if trim_value.startswith("0x"):
-                return int(trim_value[2:], 16)
-            else:
-                return int(trim_value)
 
-    if to_type == "double":
-        if from_type in ["bigint", "wei", "decimal"]:
-            return float(value)
-        if from_type == "text":
-            trim_value = value.strip()
-            if trim_value.startswith("0x"):
-                return float(int(trim_value[2:], 16))
-            else:
-                return float(trim_value)
+def _text_to_binary(value: str) -> bytes:
+    if value.startswith("0x"):
+        return bytes.fromhex(value[2:])
+    try:
+        return base64.b64decode(value, validate=True)
+    except binascii.Error:
+        raise ValueError(value)
 
-    # decimal and wei behave identically when converted from/to
-    if to_type in ["decimal", "wei"]:
-        # get target class
-        decimal_cls = Decimal if to_type == "decimal" else Wei
-
-        if from_type in ["bigint", "wei", "decimal", "double"]:
-            return decimal_cls(value)
-        if from_type == "text":
-            trim_value = value.strip()
-            if trim_value.startswith("0x"):
-                return decimal_cls(int(trim_value[2:], 16))
-            # elif "." not in trim_value and "e" not in trim_value:
-            #     return int(trim_value)
-            else:
-                try:
-                    return decimal_cls(trim_value)
-                except InvalidOperation:
-                    raise ValueError(trim_value)
 
+def _bigint_to_binary(value: int) -> bytes:
+    return value.to_bytes((value.bit_length() + 7) // 8, "little")
+
+
+def _number_to_bigint(value: Any) -> int:
+    if value % 1 != 0:
+        # only integer decimals and floats can be coerced
+        raise ValueError(value)
+    return int(value)
+
+
+def _text_to_bigint(value: str) -> int:
+    # int and float ignore surrounding whitespace so plain numbers are parsed
+    # without stripping and prefix checks
+    if "x" not in value:
+        return int(value)
+    trim_value = value.strip()
+    if trim_value.startswith("0x"):
+        return int(trim_value[2:], 16)
+    return int(trim_value)
+
+
+def _text_to_double(value: str) -> float:
+    if "x" not in value:
+        return float(value)
+    trim_value = value.strip()
+    if trim_value.startswith("0x"):
+        return float(int(trim_value[2:], 16))
+    return float(trim_value)
+
+
+def _text_to_decimal_cls(decimal_cls: Type[Decimal], value: str) -> Decimal:
+    trim_value = value.strip()
+    if trim_value.startswith("0x"):
+        return decimal_cls(int(trim_value[2:], 16))
     try:
-        if to_type == "timestamp":
-            return ensure_pendulum_datetime(value)
+        return decimal_cls(trim_value)
+    except InvalidOperation:
+        raise ValueError(trim_value)
+
 
-        if to_type == "date":
-            return ensure_pendulum_date(value)
+def _text_to_decimal(value: str) -> Decimal:
+    return _text_to_decimal_cls(Decimal, value)
 
-        if to_type == "time":
-            return ensure_pendulum_time(value)
+
+def _text_to_wei(value: str) -> Wei:
+    return _text_to_decimal_cls(Wei, value)  # type: ignore[return-value]
+
+
+def _to_timestamp(value: Any) -> datetime.datetime:
+    try:
+        return ensure_pendulum_datetime(value)
     except OverflowError as e:
         # when parsed data is converted to integer and must stay within some size
         # id that is not possible OverflowError is raised and text cannot be represented as datetime
         raise ValueError(value) from e
 
-    if to_type == "bool":
-        if from_type == "text":
-            return str2bool(value)
-        if from_type not in ["json", "binary", "timestamp"]:
-            # all the numeric types will convert to bool on 0 - False, 1 - True
-            return bool(value)
 
+def _to_date(value: Any) -> datetime.date:
+    try:
+        return ensure_pendulum_date(value)
+    except OverflowError as e:
+        raise ValueError(value) from e
+
+
+def _to_time(value: Any) -> datetime.time:
+    try:
+        return ensure_pendulum_time(value)
+    except OverflowError as e:
+        raise ValueError(value) from e
+
+
+def _cannot_coerce(value: Any) -> Any:
     raise ValueError(value)
+
+
+_COERCERS: Dict[Tuple[TDataType, TDataType], Callable[[Any], Any]] = {
+    ("json", "text"): _text_to_json,
+    ("text", "json"): json_to_str,
+    ("binary", "text"): _text_to_binary,
+    ("binary", "bigint"): _bigint_to_binary,
+    ("bigint", "wei"): _number_to_bigint,
+    ("bigint", "decimal"): _number_to_bigint,
+    ("bigint", "double"): _number_to_bigint,
+    ("bigint", "text"): _text_to_bigint,
+    ("double", "bigint"): float,
+    ("double", "wei"): float,
+    ("double", "decimal"): float,
+    ("double", "text"): _text_to_double,
+    # decimal and wei behave identically when converted from/to
+    ("decimal", "bigint"): Decimal,
+    ("decimal", "wei"): Decimal,
+    ("decimal", "double"): Decimal,
+    ("decimal", "text"): _text_to_decimal,
+    ("wei", "bigint"): Wei,
+    ("wei", "decimal"): Wei,
+    ("wei", "double"): Wei,
+    ("wei", "text"): _text_to_wei,
+    ("bool", "text"): str2bool,
+    ("bool", "json"): _cannot_coerce,
+    ("bool", "binary"): _cannot_coerce,
+    ("bool", "timestamp"): _cannot_coerce,
+}
+"""Coercions for a particular (to_type, from_type) pair"""
+
+_DEFAULT_COERCERS: Dict[TDataType, Callable[[Any], Any]] = {
+    "text": _to_text,
+    "timestamp": _to_timestamp,
+    "date": _to_date,
+    "time": _to_time,
+    # all the numeric types will convert to bool on 0 - False, 1 - True
+    "bool": bool,
+}
+"""Coercions into to_type used when (to_type, from_type) pair has no specific coercion"""
+
+# resolve default coercions for all known pairs upfront so a single lookup finds the coercion
+_COERCERS.update({
+    (to_type, from_type): coercer
+    for to_type, coercer in _DEFAULT_COERCERS.items()
+    for from_type in DATA_TYPES
+    if from_type != to_type and (to_type, from_type) not in _COERCERS
+})
+
+
+def coerce_value(to_type: TDataType, from_type: TDataType, value: Any) -> Any:
+    if to_type == from_type:
+        if to_type == "json":
+            # nested types need custom encoding to be removed
+            return map_nested_in_place(custom_pua_remove, value)
+        # Make sure we use enum value instead of the object itself
+        # This check is faster than `isinstance(value, Enum)` for non-enum types
+        if hasattr(value, "value"):
+            if to_type == "text":
+                return str(value.value)
+            elif to_type == "bigint":
+                return int(value.value)
+        return value
+
+    coercer = _COERCERS.get((to_type, from_type))
+    if coercer is None:
+        # from_type outside of known data types
+        coercer = _DEFAULT_COERCERS.get(to_type)
+        if coercer is None:
+            raise ValueError(value)
+    return coercer(value)
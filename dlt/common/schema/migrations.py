@@ -6,6 +6,7 @@ from dlt.common.schema.typing import (
     LOADS_TABLE_NAME,
     VERSION_TABLE_NAME,
     TSimpleRegex,
+    TSchemaTables,
     TStoredSchema,
     TTableSchemaColumns,
     TColumnDefaultHint,
@@ -53,37 +54,38 @@ def migrate_schema(schema_dict: DictStrAny, from_engine: int, to_engine: int) ->
         }
         # repackage tables
         old_tables: Dict[str, TTableSchemaColumns] = schema_dict.pop("tables")
-        current["tables"] = {}
+        new_tables: TSchemaTables = {}
+        current["tables"] = new_tables
         for name, columns in old_tables.items():
-            # find last path separator
-            parent = name
-            # go back in a loop to find existing parent
-            while True:
-                idx = parent.rfind("__")
-                if idx > 0:
-                    parent = parent[:idx]
-                    if parent not in old_tables:
-                        continue
-                else:
-                    parent = None
-                break
+            parent = None
+            # go back from the last path separator to find existing parent
+            idx = len(name)
+            while (idx := name.rfind("__", 0, idx)) > 0:
+                if name[:idx] in old_tables:
+                    parent = name[:idx]
+                    break
             nt = new_table(name, parent)
             nt["columns"] = columns
-            current["tables"][name] = nt
+            new_tables[name] = nt
         # assign exclude and include to tables
 
         def migrate_filters(group: str, filters: List[str]) -> None:
-            # existing filter were always defined at the root table. find this table and move filters
+            # existing filter were always defined at the root table. group them by this table
+            root_filters: Dict[str, List[TSimpleRegex]] = {}
             for f in filters:
+                sep_idx = f.find("__")
                 # skip initial ^
-                root = f[1 : f.find("__")]
-                path = f[f.find("__") + 2 :]
-                t = current["tables"].get(root)
+                root = f[1:sep_idx]
+                path = f[sep_idx + 2 :]
+                root_filters.setdefault(root, []).append(TSimpleRegex("re:^" + path))
+            # find root tables and move filters
+            for root, regexes in root_filters.items():
+                t = new_tables.get(root)
                 if t is None:
                     # must add new table to hold filters
                     t = new_table(root)
-                    current["tables"][root] = t
-                t.setdefault("filters", {}).setdefault(group, []).append("re:^" + path)  # type: ignore
+                    new_tables[root] = t
+                t.setdefault("filters", {}).setdefault(group, []).extend(regexes)  # type: ignore
 
         excludes = schema_dict.pop("excludes", [])
         migrate_filters("excludes", excludes)
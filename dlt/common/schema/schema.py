@@ -229,13 +229,16 @@ class Schema:
         table_columns = table["columns"]
 
         new_row: DictStrAny = {}
+        # bind per value methods once per row
+        coerce_null_value = self._coerce_null_value
+        coerce_non_null_value = self._coerce_non_null_value
         for col_name, v in row.items():
             # skip None values, we should infer the types later
             if v is None:
                 # just check if column is nullable if it exists
-                self._coerce_null_value(table_columns, table_name, col_name)
+                coerce_null_value(table_columns, table_name, col_name)
             else:
-                new_col_name, new_col_def, new_v = self._coerce_non_null_value(
+                new_col_name, new_col_def, new_v = coerce_non_null_value(
                     table_columns, table_name, col_name, v
                 )
                 new_row[new_col_name] = new_v
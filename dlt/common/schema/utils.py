@@ -1,6 +1,7 @@
 import re
 import base64
 import hashlib
+import pickle
 import warnings
 import yaml
 from copy import deepcopy, copy
@@ -59,6 +60,7 @@ from dlt.common.warnings import Dlt100DeprecationWarning
 
 RE_NON_ALPHANUMERIC_UNDERSCORE = re.compile(r"[^a-zA-Z\d_]")
 DEFAULT_WRITE_DISPOSITION: TWriteDisposition = "append"
+_SCHEMA_NAME_NAMING = SnakeCase(InvalidSchemaName.MAXIMUM_SCHEMA_NAME_LENGTH)
 
 
 def is_valid_schema_name(name: str) -> bool:
@@ -78,8 +80,7 @@ def is_nested_table(table: TTableSchema) -> bool:
 
 def normalize_schema_name(name: str) -> str:
     """Normalizes schema name by using snake case naming convention. The maximum length is 64 characters"""
-    snake_case = SnakeCase(InvalidSchemaName.MAXIMUM_SCHEMA_NAME_LENGTH)
-    return snake_case.normalize_identifier(name)
+    return _SCHEMA_NAME_NAMING.normalize_identifier(name)
 
 
 def apply_defaults(stored_schema: TStoredSchema) -> TStoredSchema:
@@ -90,13 +91,9 @@ def apply_defaults(stored_schema: TStoredSchema) -> TStoredSchema:
     for table_name, table in stored_schema["tables"].items():
         # overwrite name
         table["name"] = table_name
-        for column_name in table["columns"]:
-            # add default hints to tables
-            column = table["columns"][column_name]
+        for column_name, column in table["columns"].items():
             # overwrite column name
             column["name"] = column_name
-            # set column with default
-            # table["columns"][column_name] = column
         # add default write disposition to root tables
         if not is_nested_table(table):
             if table.get("write_disposition") is None:
@@ -112,7 +109,10 @@ def remove_defaults(stored_schema: TStoredSchema) -> TStoredSchema:
     * removes column and table names from the value
     * removed resource name if same as table name
     """
-    clean_tables = deepcopy(stored_schema["tables"])
+    # tables hold only plain, picklable values: a pickle round trip clones them much faster than deepcopy
+    clean_tables = pickle.loads(
+        pickle.dumps(stored_schema["tables"], protocol=pickle.HIGHEST_PROTOCOL)
+    )
     for table in clean_tables.values():
         del table["name"]
         # if t.get("resource") == table_name:
@@ -133,8 +133,9 @@ def remove_defaults(stored_schema: TStoredSchema) -> TStoredSchema:
 def has_default_column_prop_value(prop: str, value: Any) -> bool:
     """Checks if `value` is a default for `prop`."""
     # remove all boolean hints that are False, except "nullable" which is removed when it is True
-    if prop in ColumnPropInfos:
-        return value in ColumnPropInfos[prop].defaults
+    prop_info = ColumnPropInfos.get(prop)
+    if prop_info is not None:
+        return value in prop_info.defaults
     # for any unknown hint ie. "x-" the defaults are
     return value in (None, False)
 
@@ -142,9 +143,8 @@ def has_default_column_prop_value(prop: str, value: Any) -> bool:
 def remove_column_defaults(column_schema: TColumnSchema) -> TColumnSchema:
     """Removes default values from `column_schema` in place, returns the input for chaining"""
     # remove hints with default values
-    for h in list(column_schema.keys()):
-        if has_default_column_prop_value(h, column_schema[h]):  # type: ignore
-            del column_schema[h]  # type: ignore
+    for h in [h for h, v in column_schema.items() if has_default_column_prop_value(h, v)]:
+        del column_schema[h]  # type: ignore
     return column_schema
 
 
@@ -466,10 +466,9 @@ def diff_table(
     for col_b_name, col_b in tab_b["columns"].items():
         if col_b_name in tab_a_columns:
             col_a = tab_a_columns[col_b_name]
-            # all other properties can change
-            merged_column = merge_column(copy(col_a), col_b)
-            if merged_column != col_a:
-                new_columns.append(merged_column)
+            # all other properties can change, merge only if any hint is new or different
+            if any(h not in col_a or col_a[h] != v for h, v in col_b.items()):  # type: ignore[literal-required]
+                new_columns.append(merge_column(copy(col_a), col_b))
         else:
             new_columns.append(col_b)
 
@@ -1018,8 +1017,9 @@ def new_table(
         if not resource:
             table["resource"] = table_name
 
-    # migrate complex types to json
-    migrate_complex_types(table, warn=True)
+    if columns:
+        # migrate complex types to json
+        migrate_complex_types(table, warn=True)
 
     if validate_schema:
         validate_dict_ignoring_xkeys(
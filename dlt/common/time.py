@@ -17,6 +17,8 @@ from dlt.common.typing import TimedeltaSeconds, TAnyDateTime
 PAST_TIMESTAMP: float = 0.0
 FUTURE_TIMESTAMP: float = 9999999999.0
 DAY_DURATION_SEC: float = 24 * 60 * 60.0
+RE_NUMERIC_TIMESTAMP = re.compile(r"\s*(?:[-+]?(?:\d+\.\d*|\.\d+)|[-+]\d+|\d{9,})\s*")
+"""Matches numeric strings that cannot be ISO dates: fractions, signed numbers and 9+ digit integers"""
 
 precise_time: Callable[[], float] = None
 """A precise timer using win_precise_time library on windows and time.time on other systems"""
@@ -298,6 +300,10 @@ def _datetime_from_ts_or_iso(
 ) -> Union[pendulum.DateTime, pendulum.Date, pendulum.Time]:
     if isinstance(value, (int, float)):
         return pendulum.from_timestamp(value)
+    # skip iso parsers that would raise on unix timestamps passed as text,
+    # dates separated with "-" are never timestamps and go straight to the parser
+    if value[4:5] != "-" and RE_NUMERIC_TIMESTAMP.fullmatch(value):
+        return pendulum.from_timestamp(float(value))
     try:
         return parse_iso_like_datetime(value)
     except ValueError:
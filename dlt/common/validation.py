@@ -1,7 +1,7 @@
 import contextlib
 import functools
 import inspect
-from typing import Callable, Any, List, Type
+from typing import Callable, Any, Dict, FrozenSet, List, Tuple, Type
 from typing_extensions import get_type_hints, get_args
 
 from dlt.common.exceptions import DictValidationException
@@ -25,6 +25,14 @@ TFilterFunc = Callable[[str], bool]
 TCustomValidator = Callable[[str, str, Any, Any], bool]
 
 
+@functools.lru_cache(maxsize=None)
+def _get_spec_props(spec: Type[_TypedDict]) -> Tuple[Dict[str, Any], FrozenSet[str]]:
+    """Returns type hints of all fields in `spec` and names of required fields, cached per spec"""
+    allowed_props = get_type_hints(spec)
+    required_props = frozenset(k for k, v in allowed_props.items() if not is_optional_type(v))
+    return allowed_props, required_props
+
+
 def validate_dict(
     spec: Type[_TypedDict],
     doc: StrAny,
@@ -58,14 +66,13 @@ def validate_dict(
     # can't validate anything
     validator_f = validator_f or (lambda p, pk, pv, t: False)
 
-    allowed_props = get_type_hints(spec)
-    required_props = {k: v for k, v in allowed_props.items() if not is_optional_type(v)}
+    allowed_props, required_props = _get_spec_props(spec)
     # remove optional props
     props = {k: v for k, v in doc.items() if filter_f(k)}
     # check missing props
-    missing = set(required_props.keys()).difference(props.keys())
+    missing = required_props.difference(props.keys())
     if len(missing):
-        raise DictValidationException(f"following required fields are missing {missing}", path)
+        raise DictValidationException(f"following required fields are missing {set(missing)}", path)
     # check unknown props
     unexpected = set(props.keys()).difference(allowed_props.keys())
     if len(unexpected):
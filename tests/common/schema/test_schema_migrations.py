@@ -65,6 +65,68 @@ def test_upgrade_engine_v1_schema() -> None:
     assert upgraded["engine_version"] == 10
 
 
+def test_engine_v2_tables_and_filters_migration() -> None:
+    schema_dict: DictStrAny = {
+        "version": 1,
+        "engine_version": 2,
+        "name": "event",
+        "tables": {
+            "a": {},
+            "a__b": {},
+            # parent is found by skipping non existing path segments
+            "a__b__c__d": {},
+            "a___b": {},
+            "a___b__c": {},
+            # "a__" does not exist, "a" is the parent
+            "a____b": {},
+            # no existing parent
+            "x__y": {},
+        },
+        "excludes": ["^a__b__c", "^a__d", "^z__f", "^a__e", "^nosep"],
+        "includes": ["^a__b__c__d", "^x__y__value"],
+        "hints": {},
+        "preferred_types": {},
+    }
+    upgraded = migrate_schema(schema_dict, from_engine=2, to_engine=3)
+    assert upgraded["engine_version"] == 3
+    tables = upgraded["tables"]
+    assert list(tables) == [
+        "a",
+        "a__b",
+        "a__b__c__d",
+        "a___b",
+        "a___b__c",
+        "a____b",
+        "x__y",
+        "z",
+        "nose",
+        "x",
+    ]
+    assert {name: t.get("parent") for name, t in tables.items()} == {
+        "a": None,
+        "a__b": "a",
+        "a__b__c__d": "a__b",
+        "a___b": None,
+        "a___b__c": "a___b",
+        "a____b": "a",
+        "x__y": None,
+        "z": None,
+        "nose": None,
+        "x": None,
+    }
+    # filters are grouped at the root table in the order of definition
+    assert tables["a"]["filters"] == {
+        "excludes": ["re:^b__c", "re:^d", "re:^e"],
+        "includes": ["re:^b__c__d"],
+    }
+    # tables are created for roots that hold filters only
+    assert tables["x"]["filters"] == {"includes": ["re:^y__value"]}
+    assert tables["z"]["filters"] == {"excludes": ["re:^f"]}
+    assert tables["nose"]["filters"] == {"excludes": ["re:^nosep"]}
+    for name in ("a__b", "a__b__c__d", "a___b", "a___b__c", "a____b", "x__y"):
+        assert "filters" not in tables[name]
+
+
 def test_complex_type_migration() -> None:
     schema_dict: DictStrAny = load_json_case("schemas/rasa/event.schema")
     upgraded = migrate_schema(schema_dict, from_engine=schema_dict["engine_version"], to_engine=10)
@@ -79,6 +79,11 @@ test_params = [
     ),
     # iso date
     ("2021-01-01", pendulum.DateTime(2021, 1, 1, 0, 0, 0).in_tz("UTC")),
+    # compact iso date is not a timestamp
+    ("20210101", pendulum.DateTime(2021, 1, 1, 0, 0, 0).in_tz("UTC")),
+    # unix timestamps as text
+    ("1609459200", pendulum.DateTime(2021, 1, 1, 0, 0, 0).in_tz("UTC")),
+    (" 1609459200.5 ", pendulum.DateTime(2021, 1, 1, 0, 0, 0, 500000).in_tz("UTC")),
 ]
 
 